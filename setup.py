@@ -13,9 +13,9 @@ setup(
     install_requires=[
         'selenium>=4.0.0',
         'beautifulsoup4>=4.11.0',
+        'soupsieve>=2.3',
         'requests>=2.28.0',
         'webdriver-manager>=3.8.0',
         'lxml>=4.9.0',
-        'nltk>=3.8.0',
     ],
 )
\ No newline at end of file
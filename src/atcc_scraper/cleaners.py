@@ -3,31 +3,14 @@
 # ============================================================================
 
 import re
-import nltk
-from nltk.tokenize import sent_tokenize
-
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab')
-
-try:
-    nltk.data.find('taggers/averaged_perceptron_tagger_eng')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger_eng')
 
 
 class TextCleaner:
     """Utilities for cleaning and normalizing text"""
     
+    # '\xa0' and '\u00a0' are the same codepoint (non-breaking space);
+    # it is normalized to a regular space
     UNICODE_REPLACEMENTS = {
-        '\xa0': '',
         '\xad': '',
         '\u00a0': ' ',
         '\u2264': 'less than or equal to ',
@@ -35,6 +18,24 @@ class TextCleaner:
         '\u00b1': 'plus/minus ',
         '\u2013': '-'
     }
+    _TRANS = str.maketrans(UNICODE_REPLACEMENTS)
+    
+    # Temperature and ATCC product reference rules, applied in a single pass
+    _RE_ALL = re.compile(
+        r'(?P<temp>(\d+)\u00b0C)'
+        r'|(?P<atcc_semi> \([^;]+;\s*ATCC\s[^\)]+\))'
+        r'|(?P<atcc> \(ATCC\s[^\)]+\))'
+    )
+    
+    @staticmethod
+    def _dispatch(match):
+        """Return the replacement for a match of _RE_ALL"""
+        if match.lastgroup == 'temp':
+            # e.g., 37°C -> 37 degrees Celsius
+            return match.group(2) + ' degrees Celsius'
+        
+        # ATCC product references are removed
+        return ''
     
     @staticmethod
     def clean_text(text):
@@ -43,35 +44,38 @@ class TextCleaner:
             return None
         
         # Replace unicode characters
-        for unicode_char, replacement in TextCleaner.UNICODE_REPLACEMENTS.items():
-            text = text.replace(unicode_char, replacement)
-        
-        # Tokenize sentences and strip whitespace
-        sentences = sent_tokenize(text)
-        stripped_sentences = [sent.strip() for sent in sentences]
-        text = ' '.join(stripped_sentences)
+        text = text.translate(TextCleaner._TRANS)
         
-        # Handle temperature unicode (e.g., 37°C)
-        text = re.sub(r'(\d+)\u00b0C', r'\1 degrees Celsius', text)
+        # Normalize whitespace
+        text = ' '.join(text.split())
         
-        # Remove ATCC product references
-        text = re.sub(r' \(([^;]+);\s*ATCC\s([^\)]+)\)', '', text)
-        text = re.sub(r' \(ATCC\s([^\)]+)\)', '', text)
+        # Handle temperature unicode and remove ATCC product references
+        text = TextCleaner._RE_ALL.sub(TextCleaner._dispatch, text)
         
         return text
     
     @staticmethod
     def clean_list(items):
         """Clean a list of text items"""
-        return [TextCleaner.clean_text(item) for item in items if item.strip()]
+        cleaned = []
+        clean_text = TextCleaner.clean_text
+        for item in items:
+            item = item.strip()
+            if item:
+                cleaned.append(clean_text(item))
+        return cleaned
     
     @staticmethod
     def normalize_html_tags(soup):
         """Normalize superscript and subscript tags in BeautifulSoup"""
-        for sup in soup.find_all('sup'):
-            sup.string = '^' + sup.get_text()
-            sup.unwrap()
+        # Collect both tag types in a single traversal before mutating the tree;
+        # superscripts are handled first, as they were with separate passes
+        tags = soup.find_all(['sup', 'sub'])
+        targets = [(tag, '^') for tag in tags if tag.name == 'sup'] + [(tag, '_') for tag in tags if tag.name == 'sub']
         
-        for sub in soup.find_all('sub'):
-            sub.string = '_' + sub.get_text()
-            sub.unwrap()
\ No newline at end of file
+        for tag, prefix in targets:
+            # Nested tags are detached when their outer tag's text is replaced
+            if tag.parent is None:
+                continue
+            tag.string = prefix + tag.get_text()
+            tag.unwrap()
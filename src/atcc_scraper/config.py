@@ -9,15 +9,20 @@ class Config:
     TOTAL_CELLS = 1655
     CELLS_PER_PAGE = 48 # 24 or 48
     CELLS_ON_LAST_PAGE = TOTAL_CELLS % CELLS_PER_PAGE
+    MAX_WORKERS = 16 # concurrent cell page requests
 
     # URLs
     BASE_URL = 'https://www.atcc.org'
     SEARCH_URL = f'{BASE_URL}/cell-products/animal-cells#t=productTab&numberOfResults={CELLS_PER_PAGE}&f:Productcategory=[Animal%20cells]'
     
+    # BeautifulSoup parser backend (C-based lxml)
+    HTML_PARSER = 'lxml'
+    
     # Timeouts and waits
     PAGE_LOAD_TIMEOUT = 10
     STANDARD_WAIT = 10
     LAST_PAGE_WAIT = 60
+    POLL_FREQUENCY = 0.1
     
     # CSS Selectors
     class Selectors:
@@ -36,5 +41,7 @@ class Config:
     
     # File paths
     LINKS_FILE = 'output_data/cell_names_links.json'
+    LINKS_CHECKPOINT_FILE = 'output_data/cell_names_links.jsonl'
     OUTPUT_DIR = 'output_data/cell_protocols'
     MERGED_FILE = 'output_data/cell_protocols.json'
+    PAGE_CACHE_DIR = None # e.g. 'output_data/page_cache' to enable conditional re-crawls
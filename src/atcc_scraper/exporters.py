@@ -4,45 +4,92 @@
 
 import json
 import os
-import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class DataExporter:
     """Handle data export to JSON files"""
     
+    # Characters not allowed in filenames
+    _FN_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+    
+    # Output directories already created in this process
+    _created_dirs = set()
+    
+    @staticmethod
+    def _dump(data, filepath):
+        """Write data to a JSON file with 2-space indentation, using orjson when it is installed"""
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+    
+    @staticmethod
+    def cell_filename(cell_name):
+        """Return the sanitized JSON filename for a cell"""
+        return (cell_name + '.json').translate(DataExporter._FN_TRANS)
+    
     @staticmethod
     def save_cell_protocol(cell_name, cell_data, output_dir):
         """Save individual cell protocol to JSON file"""
-        # Sanitize filename
-        filename = re.sub(r'[<>:"/\\|?*]', '_', f'{cell_name}.json')
+        filename = DataExporter.cell_filename(cell_name)
         filepath = os.path.join(output_dir, filename)
         
-        os.makedirs(output_dir, exist_ok=True)
+        if output_dir not in DataExporter._created_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            DataExporter._created_dirs.add(output_dir)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump({cell_name: cell_data}, f, indent=4)
+        DataExporter._dump({cell_name: cell_data}, filepath)
     
     @staticmethod
     def save_links(links_dict, filename):
         """Save cell links dictionary to JSON"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(links_dict, f, indent=4)
+        DataExporter._dump(links_dict, filename)
     
     @staticmethod
     def merge_protocols(input_dir, output_file):
-        """Merge all individual JSON files into one"""
-        merged_data = {}
+        """
+        Merge all individual JSON files into one
+        
+        Each file holds a single {cell_name: cell_data} object, so its body is
+        copied into the merged object as-is instead of being decoded and
+        re-encoded.
+        
+        Returns:
+            int: Number of cell protocols merged
+        """
+        count = 0
         
-        for filename in os.listdir(input_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(input_dir, filename)
+        with open(output_file, 'w', encoding='utf-8') as out:
+            out.write('{\n')
+            
+            for entry in sorted(os.scandir(input_dir), key=lambda e: e.name):
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
                 
+                filepath = entry.path
                 with open(filepath, 'r', encoding='utf-8') as f:
-                    cell_data = json.load(f)
+                    raw = f.read().strip()
                 
-                merged_data.update(cell_data)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(merged_data, f, indent=4)
+                if not (raw.startswith('{') and raw.endswith('}')):
+                    raise ValueError(f"{filepath} does not contain a JSON object")
+                
+                # Keep the file's own indentation
+                body = raw[1:-1].rstrip().lstrip('\r\n')
+                if not body.strip():
+                    continue
+                
+                if count:
+                    out.write(',\n')
+                out.write(body)
+                count += 1
+            
+            out.write('\n}')
         
-        return merged_data
\ No newline at end of file
+        return count
@@ -4,11 +4,12 @@
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from typing import Optional
 
 from .config import Config
-from .scraper import ATCCScraper
+from .scraper import ATCCScraper, PageCache
 from .exporters import DataExporter
 from .parsers import *
 
@@ -21,15 +22,18 @@ class ATCCPipeline:
         self.links_file = Config.LINKS_FILE
         self.merged_file = Config.MERGED_FILE
         self.unscraped_cells = {}
+        self.page_cache = PageCache(Config.PAGE_CACHE_DIR) if Config.PAGE_CACHE_DIR else None
+        
+        os.makedirs(self.output_dir, exist_ok=True)
     
-    def scrape_links(self, driver):
-        """Step 1: Scrape all cell links from ATCC website"""
+    def scrape_links(self, driver, resume=False):
+        """Step 1: Scrape all cell links from ATCC website (resume continues from the checkpoint)"""
         print("=" * 60)
         print("STEP 1: Scraping cell links from ATCC website")
         print("=" * 60)
         
-        scraper = ATCCScraper(driver)
-        links_dict = scraper.scrape_cell_links()
+        scraper = ATCCScraper(driver, checkpoint_file=Config.LINKS_CHECKPOINT_FILE)
+        links_dict = scraper.scrape_cell_links(resume=resume)
         
         print(f"\nTotal cells found: {len(links_dict)}")
         print(f"Repeated cells: {len(scraper.repeated_cells)}")
@@ -46,80 +50,79 @@ class ATCCPipeline:
         print("STEP 2: Processing cell data")
         print("=" * 60)
         
-        total_cells = len(links_dict)
-        cell_id = 1
+        items = list(links_dict.items())
+        total_cells = len(items)
         
         # Handle resume from specific cell
-        iterator = iter(links_dict.items())
+        start = 0
         if start_key:
-            for cell_name, url in iterator:
-                if cell_name == start_key:
-                    print(f"Resuming from: {cell_name} (ID: {cell_id})")
-                    break
-                cell_id += 1
+            start = next((i for i, (cell_name, _) in enumerate(items) if cell_name == start_key), None)
+            if start is None:
+                print(f"Cell {start_key} not found in links")
+                return
+            print(f"Resuming from: {start_key} (ID: {start + 1})")
         
-        # Process each cell
-        for cell_name, url in tqdm(iterator, desc="Scraping cells", ncols=100):
-            cell_file_path = os.path.join(self.output_dir, cell_name + ".json")
-
-            # first check if the cell information was already extracted
-            if not os.path.exists(cell_file_path):
-                try:
-                    tqdm.write(f"[{cell_id}/{total_cells}] Processing: {cell_name}...")
-                    # Scrape page
-                    soup = ATCCScraper.scrape_cell_page(url)
-                    if not soup:
-                        tqdm.write("FAILED (scraping error)")
-                        cell_id += 1
-                        continue
-                    
-                    # Parse data
-                    atcc_num = url.split('/')[-1].upper()
-                    cell_protocol = self._parse_cell_data(soup, cell_name, atcc_num, cell_id, url)
-                    tqdm.write(f"Parsed {cell_name}. Saving file...", end=" ")
-                    
-                    # Save to file
-                    DataExporter.save_cell_protocol(cell_name, cell_protocol, self.output_dir)
-                    
-                    tqdm.write("✓")
-                    cell_id += 1
-                    tqdm.write('-' * 60)
-                    
-                except Exception as e:
-                    tqdm.write(f"FAILED ({e})")
-                    cell_id += 1
-                    continue
+        # Files of cells whose information was already extracted
+        done = {entry.name for entry in os.scandir(self.output_dir) if entry.name.endswith('.json')}
+        
+        # Queue the remaining cells
+        pending = []
+        for cell_id, (cell_name, url) in enumerate(items[start:], start=start + 1):
+            if DataExporter.cell_filename(cell_name) not in done:
+                pending.append((cell_name, url, cell_id))
             else:
                 tqdm.write(f"Already extracted {cell_name} information.")
         
+        # Process cells concurrently; each worker scrapes, parses and saves one cell
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(_fetch_and_parse, cell_name, url, cell_id, self.output_dir, self.page_cache): (cell_name, url, cell_id)
+                for cell_name, url, cell_id in pending
+            }
+            
+            try:
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Scraping cells", ncols=100):
+                    cell_name, url, cell_id = futures[future]
+                    try:
+                        if future.result():
+                            tqdm.write(f"[{cell_id}/{total_cells}] {cell_name} ✓")
+                        else:
+                            tqdm.write(f"[{cell_id}/{total_cells}] {cell_name} FAILED (scraping error)")
+                            self.unscraped_cells[cell_name] = url
+                    except Exception as e:
+                        tqdm.write(f"[{cell_id}/{total_cells}] {cell_name} FAILED ({e})")
+                        self.unscraped_cells[cell_name] = url
+            except BaseException:
+                # Drop queued cells on interrupt so only in-flight ones finish
+                # before the executor shuts down; a later run resumes the rest
+                for future in futures:
+                    future.cancel()
+                raise
+        
         print(f"\nProcessing complete! Data saved to {self.output_dir}/")
         if len(self.unscraped_cells) > 0:
             print(f"{len(self.unscraped_cells)} cells failed during scraping: {self.unscraped_cells}")
         else:
             print("All cells successfully scraped.")
     
-    def _parse_cell_data(self, soup, cell_name, atcc_num, cell_id, url):
+    @staticmethod
+    def _parse_cell_data(soup, cell_name, atcc_num, cell_id, url):
         """Parse all data for a single cell"""
         # Basic information
         cell_protocol = BasicInfoParser.parse(soup, cell_name, atcc_num, cell_id)
-        tqdm.write("Basic info ✓")
         
         # Handling information
         handling_info = HandlingInfoParser.parse(soup)
         cell_protocol.update(handling_info)
-        tqdm.write("Handling info ✓")
         
         # Images
         cell_protocol['Images'] = ImageParser.extract_images(soup)
-        tqdm.write("Images ✓")
         
         # Price
         cell_protocol['Price'] = PriceParser.extract_price(soup)
-        tqdm.write("Price ✓")
         
         # URL
         cell_protocol['ATCC Link'] = url
-        tqdm.write("URL ✓")
         
         return cell_protocol
     
@@ -129,12 +132,12 @@ class ATCCPipeline:
         print("STEP 3: Merging all protocols")
         print("=" * 60)
         
-        merged_data = DataExporter.merge_protocols(self.output_dir, self.merged_file)
+        merged_count = DataExporter.merge_protocols(self.output_dir, self.merged_file)
         
-        print(f"Merged {len(merged_data)} cell protocols")
+        print(f"Merged {merged_count} cell protocols")
         print(f"Saved to {self.merged_file}\n")
         
-        return merged_data
+        return merged_count
     
     def run_full_pipeline(self, driver, scrape_links=True):
         """Run complete pipeline: scrape links -> process cells -> merge"""
@@ -156,6 +159,26 @@ class ATCCPipeline:
         print("=" * 60)
 
 
+def _fetch_and_parse(cell_name, url, cell_id, output_dir, cache=None):
+    """
+    Scrape, parse and save a single cell
+    
+    Runs in a worker thread and holds no shared state; each cell is
+    written to its own file.
+    
+    Returns:
+        bool: True if the cell was saved, False if the page could not be scraped
+    """
+    soup = ATCCScraper.scrape_cell_page(url, cache=cache)
+    if not soup:
+        return False
+    
+    atcc_num = url.split('/')[-1].upper()
+    cell_protocol = ATCCPipeline._parse_cell_data(soup, cell_name, atcc_num, cell_id, url)
+    DataExporter.save_cell_protocol(cell_name, cell_protocol, output_dir)
+    return True
+
+
 # ============================================================================
 # Usage Examples
 # ============================================================================
@@ -181,9 +204,13 @@ def example_usage_local():
     from selenium.webdriver.chrome.options import Options
     from webdriver_manager.chrome import ChromeDriverManager
     
-    # Setup Chrome options
+    # Setup Chrome options; don't wait for or load images the scraper never reads
     options = Options()
     options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    options.page_load_strategy = 'eager'
     
     # Setup WebDriver
     service = Service(ChromeDriverManager().install())
@@ -225,11 +252,12 @@ def example_update_prices():
     count = 0
     total = len(links_dict)
     
-    for cell_name, url in links_dict.items():
+    soups = ATCCScraper.scrape_cell_pages(links_dict.values(), cache=pipeline.page_cache)
+    
+    for (cell_name, url), soup in zip(links_dict.items(), soups):
         count += 1
         print(f"[{count}/{total}] Updating price for {cell_name}...", end=' ')
         
-        soup = ATCCScraper.scrape_cell_page(url)
         if soup:
             price = PriceParser.extract_price(soup)
             protocols[cell_name]['Price'] = price
@@ -321,6 +349,8 @@ if __name__ == "__main__":
     # import google_colab_selenium as gs
     # driver = gs.Chrome()
     # links = pipeline.scrape_links(driver)
+    # # Or continue an interrupted link scrape:
+    # # links = pipeline.scrape_links(driver, resume=True)
     # 
     # # Step 2: Process cells (can resume if interrupted)
     # pipeline.process_cells()
@@ -3,24 +3,113 @@
 # ============================================================================
 
 import re
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
+import soupsieve as sv
 
 from .config import Config
 from .cleaners import TextCleaner
 
+# Precompiled CSS selectors for the product page sections
+_SEL_BASIC_INFO = sv.compile(f'.{Config.Selectors.BASIC_INFO_COL}')
+_SEL_TITLE_DATA = sv.compile(f'.{Config.Selectors.INFO_TITLE}, .{Config.Selectors.INFO_DATA}')
+_SEL_HANDLING = sv.compile(
+    f'.{Config.Selectors.ACCORDION_ITEM}, .{Config.Selectors.INFO_LIST}, '
+    f'.{Config.Selectors.INFO_TITLE}, .{Config.Selectors.INFO_DATA}'
+)
+_SEL_IMAGE_GALLERY = sv.compile(f'.{Config.Selectors.IMAGE_GALLERY}')
+_SEL_PRICE = sv.compile(f'span.{Config.Selectors.PRICE_CURRENT}')
+
+# Imperative verbs that start a procedure step
+_ACTION_VERBS = frozenset({
+    'add', 'agitate', 'allow', 'aspirate', 'centrifuge', 'check', 'decontaminate',
+    'discard', 'dilute', 'dispense', 'incubate', 'keep', 'mix', 'observe', 'pellet',
+    'pipette', 'place', 'remove', 'replace', 'resuspend', 'rinse', 'seed', 'spin',
+    'store', 'thaw', 'transfer', 'warm', 'wash',
+})
+
+# Separators of multi-valued basic information fields
+_RE_LIST_SPLIT = re.compile(r'[,\n]')
+
+# Labels removed from procedure text
+_RE_HEADER = re.compile(r'Handling Procedure for Frozen Cells', re.IGNORECASE)
+_RE_SUBCULTURE = re.compile(r'subculture procedure', re.IGNORECASE)
+_RE_MEDIUM_RENEWAL = re.compile(r'Medium renewal', re.IGNORECASE)
+
+# Period-delimited fragments of a structured procedure, with surrounding
+# whitespace stripped: a bare step number, a dash bullet or plain text
+_STEP_SCANNER = re.compile(r'\s*(?:(?P<num>\d+)|-\s*(?P<dash>[^.]*?)|(?P<sent>[^.]*?))\s*(?:\.|\Z)')
+
+# A fragment that _STEP_SCANNER reads as a step number or dash bullet
+_RE_STEP_MARKER = re.compile(r'(?:^|\.)\s*(?:-|\d+\s*(?:\.|\Z))')
+
+# Sentence boundary: end punctuation followed by a capitalized word or a number
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9])')
+
+
+def _select_titles_and_data(section):
+    """Collect information titles and data items in a single traversal"""
+    titles = []
+    data_items = []
+    info_title_cls = Config.Selectors.INFO_TITLE
+    for element in _SEL_TITLE_DATA.select(section):
+        if info_title_cls in element.get('class', []):
+            titles.append(element)
+        else:
+            data_items.append(element)
+    return titles, data_items
+
+
+def _find_next_in(elements, start, class_name):
+    """
+    Return the index of the first element at or after start with class_name
+    
+    elements is a document-order selection, so this matches what find_next
+    returns for the element before start.
+    """
+    for i in range(start, len(elements)):
+        if class_name in elements[i].get('class', []):
+            return i
+    return None
+
+
+def _parse_text_field(data):
+    """Parse a plain text information field"""
+    return TextCleaner.clean_text(data.text)
+
+
+def _parse_list_field(data):
+    """Parse a comma or newline separated information field"""
+    return TextCleaner.clean_list(_RE_LIST_SPLIT.split(data.text))
+
+
+def _parse_tissue_field(data):
+    """Parse a semicolon separated information field"""
+    return TextCleaner.clean_list(data.text.split(';'))
+
+
+def _parse_atmosphere_field(data):
+    """Parse a comma separated information field"""
+    return TextCleaner.clean_list(data.text.split(","))
+
+
 class BasicInfoParser:
     """Parse basic cell information from product page"""
     
+    # Parsers for fields that are not plain text, keyed by title
+    _FIELD_PARSERS = {
+        'Product type': _parse_list_field,
+        'Applications': _parse_list_field,
+        'Classification': _parse_list_field,
+        'Tissue': _parse_tissue_field,
+    }
+    
     @staticmethod
     def parse(soup, cell_name, atcc_num, cell_id):
         """Extract basic cell information"""
-        cell_info_section = soup.find(class_=Config.Selectors.BASIC_INFO_COL)
+        cell_info_section = _SEL_BASIC_INFO.select_one(soup)
         if not cell_info_section:
             return None
         
-        titles = cell_info_section.find_all(class_=Config.Selectors.INFO_TITLE)
-        data_items = cell_info_section.find_all(class_=Config.Selectors.INFO_DATA)
+        titles, data_items = _select_titles_and_data(cell_info_section)
         
         cell_info = {
             'ID': cell_id,
@@ -30,17 +119,8 @@ class BasicInfoParser:
         
         for title, data in zip(titles, data_items):
             title_text = title.text.strip()
-            
-            if title_text in ['Product type', 'Applications', 'Classification']:
-                parsed_data = data.text.replace('\n', ',').split(',')
-                parsed_data = TextCleaner.clean_list(parsed_data)
-            elif title_text == "Tissue":
-                parsed_data = data.text.split(';')
-                parsed_data = TextCleaner.clean_list(parsed_data)
-            else:
-                parsed_data = TextCleaner.clean_text(data.text)
-            
-            cell_info[title_text] = parsed_data
+            field_parser = BasicInfoParser._FIELD_PARSERS.get(title_text, _parse_text_field)
+            cell_info[title_text] = field_parser(data)
         
         return cell_info
 
@@ -52,7 +132,7 @@ class ProcedureParser:
     def parse_structured_paragraph(text):
         """Parse procedures from structured paragraph format"""
         # Remove header
-        text = re.sub(r'Handling Procedure for Frozen Cells', '', text, flags=re.IGNORECASE)
+        text = _RE_HEADER.sub('', text)
         
         step_counter = 0
         steps = {}
@@ -63,42 +143,49 @@ class ProcedureParser:
         catalog_idx = text.find("CATALOG DESCRIPTION")
         if catalog_idx == -1:
             catalog_idx = len(text)
+        text = text[:catalog_idx]
         
-        for line in text[:catalog_idx].split("."):
-            line = line.strip()
-            
-            if not line:
-                continue
+        # Without step markers every fragment is description
+        if not _RE_STEP_MARKER.search(text):
+            description = [line.strip() + "." for line in text.split(".") if line.strip()]
+            return " ".join(description), steps, ""
+        
+        for match in _STEP_SCANNER.finditer(text):
+            kind = match.lastgroup
+            line = match.group(kind)
             
-            # Check if line starts with a number
-            if line.isdigit():
+            # Numbered step marker
+            if kind == 'num':
                 if step_counter > 0:
                     steps[step_counter] = " ".join(current_step)
                     current_step = []
                 step_counter += 1
             
-            # Check for dash bullet points
-            elif line and line[0] == "-":
+            # Dash bullet point
+            elif kind == 'dash':
                 if step_counter > 0:
                     steps[step_counter] = " ".join(current_step)
                     current_step = []
                 step_counter += 1
-                current_step.append(line[1:].strip() + ".")
+                current_step.append(line + ".")
+            
+            elif not line:
+                continue
             
             else:
                 # Part of description before steps
                 if not steps and step_counter < 1:
                     description.append(line + ".")
                 # Period between digits
-                elif line and line[0].isdigit():
+                elif line[0].isdigit():
                     if current_step:
                         current_step[-1] += (line + ".")
                 # Subculture procedure section
                 elif 'subculture procedure' in line.lower():
-                    line = re.sub(r'subculture procedure', '', line, flags=re.IGNORECASE)
+                    line = _RE_SUBCULTURE.sub('', line)
                     subculture_data.append(line.strip() + ".")
                 elif subculture_data:
-                    subculture_data.append(line.strip() + ".")
+                    subculture_data.append(line + ".")
                 else:
                     current_step.append(line + ".")
         
@@ -115,18 +202,15 @@ class ProcedureParser:
         description = []
         current_step = []
         
-        action_verbs = ["thaw", "remove", "allow", "add"]
-        
-        for line in sent_tokenize(text):
+        for line in _SENT_SPLIT.split(text):
             line = line.strip()
             if not line:
                 continue
             
-            # Check if sentence starts with a verb
-            pos_tags = nltk.pos_tag(word_tokenize(line))
-            first_word = pos_tags[0][0].lower()
+            # Check if sentence starts with an action verb
+            first_word = line.split(None, 1)[0].lower().rstrip(',.:;')
             
-            if pos_tags[0][1] == 'VB' or first_word in action_verbs:
+            if first_word in _ACTION_VERBS:
                 if step_counter > 0:
                     steps[step_counter] = " ".join(current_step)
                     current_step = []
@@ -171,6 +255,13 @@ class ProcedureParser:
 class HandlingInfoParser:
     """Parse handling and culture information"""
     
+    # Parsers for fields that are not plain text, keyed by title
+    _FIELD_PARSERS = {
+        'Unpacking and storage instructions': lambda data: HandlingInfoParser._parse_steps(data),
+        'Complete medium': lambda data: HandlingInfoParser._parse_medium(data),
+        'Atmosphere': _parse_atmosphere_field,
+    }
+    
     @staticmethod
     def parse(soup):
         """Extract handling information from page"""
@@ -179,52 +270,50 @@ class HandlingInfoParser:
         handling_info = {}
         subculture_info = None
         
-        accordion_items = soup.find_all(class_=Config.Selectors.ACCORDION_ITEM)
+        # Accordion items and the information elements that follow them,
+        # collected in document order in a single traversal
+        elements = _SEL_HANDLING.select(soup)
+        accordion_item_cls = Config.Selectors.ACCORDION_ITEM
         
-        for item in accordion_items:
-            if item.text == "Characteristics":
-                HandlingInfoParser._parse_characteristics(item, handling_info)
-            elif item.text == "Handling information":
-                subculture_info = HandlingInfoParser._parse_handling_details(item, handling_info)
+        for i, item in enumerate(elements):
+            if accordion_item_cls not in item.get('class', []):
+                continue
+            
+            item_text = item.text
+            if item_text == "Characteristics":
+                HandlingInfoParser._parse_characteristics(elements, i + 1, handling_info)
+            elif item_text == "Handling information":
+                subculture_info = HandlingInfoParser._parse_handling_details(elements, i + 1, handling_info)
         
         return handling_info
     
     @staticmethod
-    def _parse_characteristics(item, handling_info):
-        """Parse characteristics section"""
-        growth_prop = item.find_next(class_=Config.Selectors.INFO_TITLE)
-        if growth_prop and growth_prop.text == "Growth properties":
-            data = growth_prop.find_next(class_=Config.Selectors.INFO_DATA)
-            handling_info["Growth properties"] = TextCleaner.clean_text(data.text)
+    def _parse_characteristics(elements, start, handling_info):
+        """Parse characteristics section following elements[start - 1]"""
+        title_idx = _find_next_in(elements, start, Config.Selectors.INFO_TITLE)
+        if title_idx is not None and elements[title_idx].text == "Growth properties":
+            data_idx = _find_next_in(elements, title_idx + 1, Config.Selectors.INFO_DATA)
+            if data_idx is not None:
+                handling_info["Growth properties"] = TextCleaner.clean_text(elements[data_idx].text)
     
     @staticmethod
-    def _parse_handling_details(item, handling_info):
-        """Parse handling information section"""
-        info_list = item.find_next(class_=Config.Selectors.INFO_LIST)
-        if not info_list:
+    def _parse_handling_details(elements, start, handling_info):
+        """Parse handling information section following elements[start - 1]"""
+        list_idx = _find_next_in(elements, start, Config.Selectors.INFO_LIST)
+        if list_idx is None:
             return None
         
-        titles = info_list.find_all(class_=Config.Selectors.INFO_TITLE)
-        data_items = info_list.find_all(class_=Config.Selectors.INFO_DATA)
+        info_list = elements[list_idx]
+        
+        titles, data_items = _select_titles_and_data(info_list)
         
         subculture_info = None
         
         for title, data in zip(titles, data_items):
             title_text = title.text
             
-            if title_text == 'Unpacking and storage instructions':
-                handling_info[title_text] = HandlingInfoParser._parse_steps(data)
-            
-            elif title_text == 'Complete medium':
-                handling_info[title_text] = HandlingInfoParser._parse_medium(data)
-            
-            elif title_text == 'Temperature':
-                handling_info[title_text] = TextCleaner.clean_text(data.text)
-            
-            elif title_text == 'Atmosphere':
-                handling_info[title_text] = TextCleaner.clean_list(data.text.split(","))
-            
-            elif title_text == 'Handling procedure':
+            # Procedures depend on each other, so they are handled in order
+            if title_text == 'Handling procedure':
                 desc, steps, subculture_info = ProcedureParser.parse(data)
                 if desc or steps:
                     handling_info[title_text] = {
@@ -238,7 +327,8 @@ class HandlingInfoParser:
                 )
             
             else:
-                handling_info[title_text] = TextCleaner.clean_text(data.text)
+                field_parser = HandlingInfoParser._FIELD_PARSERS.get(title_text, _parse_text_field)
+                handling_info[title_text] = field_parser(data)
         
         return subculture_info
     
@@ -269,16 +359,16 @@ class HandlingInfoParser:
         if ol_tag:
             ol_tag.extract()
         
-        lines = data.text.splitlines() if steps else []
+        # Walk the remaining tree once
+        text = data.text
+        lines = text.splitlines() if steps else []
         
         # If no steps, try paragraph parsing
         if not steps:
-            desc, steps, _ = ProcedureParser.parse_structured_paragraph(data.text)
+            desc, steps, _ = ProcedureParser.parse_structured_paragraph(text)
             if not steps:
-                desc, steps, _ = ProcedureParser.parse_unstructured_paragraph(data.text)
-                lines = desc.splitlines()
-            else:
-                lines = desc.splitlines()
+                desc, steps, _ = ProcedureParser.parse_unstructured_paragraph(text)
+            lines = desc.splitlines()
         
         # Extract additional info
         description = []
@@ -296,7 +386,7 @@ class HandlingInfoParser:
                 for i, part in enumerate(parts[:-1]):
                     if "subcultivation ratio" in part.lower():
                         value = parts[i + 1]
-                        value = re.sub(r'Medium renewal', '', value, flags=re.IGNORECASE)
+                        value = _RE_MEDIUM_RENEWAL.sub('', value)
                         additional_info["Subcultivation ratio"] = TextCleaner.clean_text(value)
                     elif "medium renewal" in part.lower():
                         additional_info["Medium renewal"] = TextCleaner.clean_text(parts[i + 1])
@@ -318,7 +408,7 @@ class ImageParser:
     def extract_images(soup):
         """Extract image URLs and labels from page"""
         images = []
-        image_elements = soup.find_all(class_=Config.Selectors.IMAGE_GALLERY)
+        image_elements = _SEL_IMAGE_GALLERY.select(soup)
         
         for element in image_elements:
             img_tag = element.find('img')
@@ -336,7 +426,7 @@ class PriceParser:
     @staticmethod
     def extract_price(soup):
         """Extract price from product page"""
-        price_element = soup.find('span', class_=Config.Selectors.PRICE_CURRENT)
+        price_element = _SEL_PRICE.select_one(soup)
         if not price_element:
             return None
         
@@ -2,89 +2,168 @@
 # scraper.py - Web Scraping Logic
 # ============================================================================
 
-import time
+import hashlib
+import json
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import Config
 
+# Shared HTTP session so cell page requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=Config.MAX_WORKERS,
+    pool_maxsize=Config.MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+# Only build the page sections read by the parsers. Every class the parsers
+# search for is kept, so find_next lookups still see the same elements in
+# document order.
+_KEEP_CLASSES = frozenset({
+    Config.Selectors.BASIC_INFO_COL,
+    Config.Selectors.ACCORDION_ITEM,
+    Config.Selectors.INFO_LIST,
+    Config.Selectors.INFO_TITLE,
+    Config.Selectors.INFO_DATA,
+    Config.Selectors.IMAGE_GALLERY,
+    Config.Selectors.PRICE_CURRENT,
+})
+
+# While parsing, the strainer sees the raw class attribute string, so it is
+# split into tokens to match multi-class elements like find(class_=...) does
+_PAGE_STRAINER = SoupStrainer(class_=lambda value: bool(value) and not _KEEP_CLASSES.isdisjoint(value.split()))
+
+# Returns [name, link] for the product link of each cell on a listing page,
+# or null for cells without one
+_EXTRACT_CELLS_SCRIPT = f"""
+return Array.from(document.getElementsByClassName('{Config.Selectors.CELL_LIST}')).map(cell => {{
+    const card = cell.getElementsByClassName('{Config.Selectors.PRODUCT_CARD}')[0];
+    const link = card && card.getElementsByClassName('{Config.Selectors.RESULT_LINK}')[0];
+    return link ? [link.innerText.trim(), link.href] : null;
+}});
+"""
+
 class ATCCScraper:
     """Main scraper class for ATCC website"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, checkpoint_file=None):
         """
         Initialize scraper with Selenium driver
         
         Args:
             driver: Selenium WebDriver instance (Chrome, Firefox, etc.)
+            checkpoint_file: Optional JSONL file that each page's cell names
+                and links are appended to as they are scraped, so an
+                interrupted session can be resumed
         """
         self.driver = driver
+        self.checkpoint_file = checkpoint_file
         self.cells_dict = {}
-        self.seen_cells = set()
-        self.repeated_cells = []
+        self._counts = Counter()
     
-    def scrape_cell_links(self):
+    @property
+    def seen_cells(self):
+        """Set of all cell names seen so far"""
+        return set(self._counts)
+    
+    @property
+    def repeated_cells(self):
+        """Cell names seen more than once, listed once per repeat"""
+        return [name for name, count in self._counts.items() for _ in range(count - 1)]
+    
+    def scrape_cell_links(self, resume=False):
         """
         Scrape all cell product links from ATCC website
         
+        Args:
+            resume: Continue from the checkpoint file instead of starting
+                over; pages already recorded there are skipped
+        
         Returns:
             dict: Dictionary mapping cell names to their URLs
         """
-        self.driver.get(Config.SEARCH_URL)
-        
-        iteration = 0
-        cells_per_page = Config.CELLS_PER_PAGE
+        pages_done = 0
+        if self.checkpoint_file:
+            if resume and os.path.exists(self.checkpoint_file):
+                pages_done = self._load_checkpoint()
+                print(f"Resuming after page {pages_done} ({len(self.cells_dict)} cells loaded from checkpoint)")
+            else:
+                # Start a fresh checkpoint for this session
+                open(self.checkpoint_file, 'w', encoding='utf-8').close()
         
-        while True:
-            iteration += 1
-            print(f"Iteration: {iteration}")
+        # The driver is closed even if scraping stops early
+        try:
+            self.driver.get(Config.SEARCH_URL)
             
-            # Wait for page to load
-            WebDriverWait(self.driver, Config.PAGE_LOAD_TIMEOUT).until(
-                EC.presence_of_all_elements_located((By.CLASS_NAME, Config.Selectors.CELL_LIST))
-            )
+            iteration = 0
+            cells_per_page = Config.CELLS_PER_PAGE
+            
+            while True:
+                iteration += 1
+                print(f"Iteration: {iteration}")
+                
+                # Wait for page to load
+                WebDriverWait(self.driver, Config.PAGE_LOAD_TIMEOUT).until(
+                    EC.presence_of_all_elements_located((By.CLASS_NAME, Config.Selectors.CELL_LIST))
+                )
 
-            if iteration == 1:
+                if iteration == 1:
+                    try:
+                        cookies_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Use necessary cookies')]")
+                        cookies_button.click()
+                        print("Cleared cookies banner!")
+                    except:
+                        print("Cookies banner not found!")
+                
+                # Find next button
+                next_button_wrapper = self.driver.find_element(
+                    By.CLASS_NAME, 
+                    Config.Selectors.NEXT_BUTTON_WRAPPER
+                )
+                next_button = next_button_wrapper.find_element(
+                    By.CLASS_NAME, 
+                    Config.Selectors.NEXT_BUTTON
+                )
+                
+                # Pages already in the checkpoint are only paged through
+                if iteration > pages_done:
+                    # Wait for all cells to load on current page
+                    self._wait_for_cells(next_button, cells_per_page)
+                    
+                    # Extract cell information from current page
+                    cell_count = self._extract_cell_data(iteration)
+                    print(f"Loaded {cell_count} cells")
+                    
+                    print(f"Repeated cells so far: {sum(self._counts.values()) - len(self._counts)}")
+                    print(f"Total unique cells: {len(self.cells_dict)}\n")
+                
+                # Check if we're on the last page
+                if next_button.get_attribute('disabled'):
+                    print("Reached last page!")
+                    break
+                
+                # Click next and wait for the current cells to be replaced
+                first_cell = self.driver.find_element(By.CLASS_NAME, Config.Selectors.CELL_LIST)
+                next_button.click()
                 try:
-                    cookies_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Use necessary cookies')]")
-                    cookies_button.click()
-                    print("Cleared cookies banner!")
-                except:
-                    print("Cookies banner not found!")
-            
-            # Find next button
-            next_button_wrapper = self.driver.find_element(
-                By.CLASS_NAME, 
-                Config.Selectors.NEXT_BUTTON_WRAPPER
-            )
-            next_button = next_button_wrapper.find_element(
-                By.CLASS_NAME, 
-                Config.Selectors.NEXT_BUTTON
-            )
-            
-            # Wait for all cells to load on current page
-            cell_objects = self._wait_for_cells(next_button, cells_per_page)
-            print(f"Loaded {len(cell_objects)} cells")
-            
-            # Extract cell information from current page
-            self._extract_cell_data(cell_objects)
-            
-            print(f"Repeated cells so far: {len(self.repeated_cells)}")
-            print(f"Total unique cells: {len(self.cells_dict)}\n")
-            
-            # Check if we're on the last page
-            if next_button.get_attribute('disabled'):
-                print("Reached last page!")
-                break
-            
-            # Click next and wait
-            next_button.click()
-            time.sleep(Config.STANDARD_WAIT)
+                    WebDriverWait(self.driver, Config.STANDARD_WAIT, poll_frequency=Config.POLL_FREQUENCY).until(
+                        EC.staleness_of(first_cell)
+                    )
+                except TimeoutException:
+                    pass
+        finally:
+            self.driver.quit()
         
-        self.driver.quit()
         return self.cells_dict
     
     def _wait_for_cells(self, next_button, expected_count):
@@ -94,85 +173,142 @@ class ATCCScraper:
         Args:
             next_button: Selenium element for the next page button
             expected_count: Expected number of cells per page
-            
-        Returns:
-            list: List of cell web elements
         """
-        while True:
-            cell_objects = self.driver.find_elements(
-                By.CLASS_NAME, 
-                Config.Selectors.CELL_LIST
+        # Poll the count in the browser instead of transferring every element
+        count_script = f"return document.getElementsByClassName('{Config.Selectors.CELL_LIST}').length;"
+        
+        # Not on last page - expect full page of cells
+        if not next_button.get_attribute('disabled'):
+            wait_count, timeout = expected_count, Config.STANDARD_WAIT
+        # On last page - may have fewer cells
+        else:
+            wait_count, timeout = Config.CELLS_ON_LAST_PAGE or expected_count, Config.LAST_PAGE_WAIT
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=Config.POLL_FREQUENCY).until(
+                lambda driver: driver.execute_script(count_script) >= wait_count
             )
-            
-            # Not on last page - expect full page of cells
-            if not next_button.get_attribute('disabled'):
-                if len(cell_objects) != expected_count:
-                    time.sleep(Config.STANDARD_WAIT)
-                else:
-                    break
-            # On last page - may have fewer cells
-            else:
-                time.sleep(Config.LAST_PAGE_WAIT)
-                cell_objects = self.driver.find_elements(
-                    By.CLASS_NAME, 
-                    Config.Selectors.CELL_LIST
-                )
-                break
+        except TimeoutException:
+            # Continue with the cells that did load
+            print(f"Timed out waiting for {wait_count} cells, continuing with "
+                  f"{self.driver.execute_script(count_script)}")
+    
+    def _load_checkpoint(self):
+        """
+        Seed the scraped cells from the checkpoint file
         
-        return cell_objects
+        Returns:
+            int: Number of the last listing page recorded in the checkpoint
+        """
+        last_page = 0
+        with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Line cut short by an interrupted write
+                    continue
+                self._counts[record['name']] += 1
+                self.cells_dict[record['name']] = record['url']
+                last_page = max(last_page, record['page'])
+        return last_page
     
-    def _extract_cell_data(self, cell_objects):
+    def _extract_cell_data(self, page):
         """
-        Extract cell names and links from loaded elements
+        Extract cell names and links from the loaded page
+        
+        All cells are read in a single script call rather than several
+        WebDriver round trips per cell.
         
         Args:
-            cell_objects: List of Selenium web elements containing cell data
+            page: Number of the listing page, recorded in the checkpoint
+        
+        Returns:
+            int: Number of cells found on the page
         """
-        for cell_object in cell_objects:
-            try:
-                # Find the product card
-                product_card = cell_object.find_element(
-                    By.CLASS_NAME, 
-                    Config.Selectors.PRODUCT_CARD
-                )
-                
-                # Find the link element
-                link_element = product_card.find_element(
-                    By.CLASS_NAME, 
-                    Config.Selectors.RESULT_LINK
-                )
-                
-                # Extract link and cell name
-                link = link_element.get_attribute('href')
-                cell_name = link_element.text
-                
-                # Track duplicates for debugging
-                if cell_name in self.seen_cells:
-                    self.repeated_cells.append(cell_name)
-                
-                self.seen_cells.add(cell_name)
-                self.cells_dict[cell_name] = link
-                
-            except Exception as e:
-                print(f"Error extracting cell data: {e}")
+        cell_links = self.driver.execute_script(_EXTRACT_CELLS_SCRIPT)
+        records = []
+        
+        for cell_link in cell_links:
+            if not cell_link:
+                print("Error extracting cell data: product link not found")
                 continue
+            
+            cell_name, link = cell_link
+            
+            # Track duplicates for debugging
+            self._counts[cell_name] += 1
+            self.cells_dict[cell_name] = link
+            records.append(json.dumps({'page': page, 'name': cell_name, 'url': link}) + '\n')
+        
+        # Persist this page so an interrupted session keeps its progress
+        if self.checkpoint_file and records:
+            with open(self.checkpoint_file, 'a', encoding='utf-8') as f:
+                f.writelines(records)
+        
+        return len(cell_links)
+    
+    @staticmethod
+    def scrape_cell_page(url, timeout=10, driver=None, cache=None):
+        """
+        Scrape individual cell product page
+        
+        Pages are fetched with requests; Selenium is only used as a fallback
+        when a driver is given and the fetched page lacks the product
+        information section. The pipeline never passes a driver (its link
+        scraper quits the driver before cells are processed), so the
+        fallback is for ad-hoc use with a live driver only.
+        
+        Args:
+            url: URL of the cell product page
+            timeout: Request timeout in seconds
+            driver: Optional Selenium WebDriver instance for the fallback
+            cache: Optional PageCache for conditional requests
+            
+        Returns:
+            BeautifulSoup: Parsed HTML soup object, or None if error
+        """
+        soup = ATCCScraper.scrape_cell_page_requests(url, timeout, cache)
+        if driver is None or (soup and soup.find(class_=Config.Selectors.BASIC_INFO_COL)):
+            return soup
+        
+        try:
+            driver.get(url)
+            return BeautifulSoup(driver.page_source, Config.HTML_PARSER, parse_only=_PAGE_STRAINER)
+        except Exception as e:
+            print(f"Error scraping {url} with Selenium: {e}")
+            return soup
     
     @staticmethod
-    def scrape_cell_page(url, timeout=10):
+    def scrape_cell_page_requests(url, timeout=10, cache=None):
         """
-        Scrape individual cell product page using requests
+        Scrape individual cell product page using the shared requests session
+        
+        With a cache, the request is conditional on the cached page's ETag and
+        Last-Modified headers, and the cached page is used when the server
+        answers 304 Not Modified.
         
         Args:
             url: URL of the cell product page
             timeout: Request timeout in seconds
+            cache: Optional PageCache for conditional requests
             
         Returns:
             BeautifulSoup: Parsed HTML soup object, or None if error
         """
         try:
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            headers = cache.conditional_headers(url) if cache else {}
+            response = _SESSION.get(url, timeout=timeout, headers=headers)
+            
+            if cache and response.status_code == 304:
+                content = cache.load(url)
+            else:
+                response.raise_for_status()
+                content = response.content
+                if cache:
+                    cache.store(url, response)
+            
+            return BeautifulSoup(content, Config.HTML_PARSER, parse_only=_PAGE_STRAINER)
         except requests.exceptions.RequestException as e:
             print(f"Error scraping {url}: {e}")
             return None
@@ -180,6 +316,24 @@ class ATCCScraper:
             print(f"Unexpected error scraping {url}: {e}")
             return None
     
+    @staticmethod
+    def scrape_cell_pages(urls, max_workers=Config.MAX_WORKERS, timeout=10, cache=None):
+        """
+        Scrape several cell product pages concurrently
+        
+        Args:
+            urls: Iterable of cell product page URLs
+            max_workers: Number of concurrent requests
+            timeout: Request timeout in seconds
+            cache: Optional PageCache for conditional requests
+            
+        Yields:
+            BeautifulSoup: Parsed HTML soup object (or None if error) for each
+                URL, in the same order as urls
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(lambda url: ATCCScraper.scrape_cell_page(url, timeout, cache=cache), urls)
+    
     def get_statistics(self):
         """
         Get scraping statistics
@@ -187,15 +341,78 @@ class ATCCScraper:
         Returns:
             dict: Statistics about the scraping session
         """
+        repeated_cells = self.repeated_cells
         return {
             'total_unique_cells': len(self.cells_dict),
-            'total_seen_cells': len(self.seen_cells),
-            'repeated_cells_count': len(self.repeated_cells),
-            'unique_repeated_cells': len(set(self.repeated_cells)),
-            'repeated_cells_list': self.repeated_cells
+            'total_seen_cells': len(self._counts),
+            'repeated_cells_count': len(repeated_cells),
+            'unique_repeated_cells': sum(1 for count in self._counts.values() if count > 1),
+            'repeated_cells_list': repeated_cells
         }
 
 
+class PageCache:
+    """On-disk cache of product pages and their HTTP validators"""
+    
+    def __init__(self, cache_dir):
+        """
+        Initialize cache in the given directory
+        
+        Args:
+            cache_dir: Directory holding one HTML and one JSON file per URL
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _paths(self, url):
+        """Return the page and validator file paths for a URL"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.html', base + '.json'
+    
+    def conditional_headers(self, url):
+        """
+        Build conditional request headers from the cached validators
+        
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers, empty if not cached
+        """
+        _, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def load(self, url):
+        """Return the cached page content for a URL"""
+        page_path, _ = self._paths(url)
+        with open(page_path, 'rb') as f:
+            return f.read()
+    
+    def store(self, url, response):
+        """Cache a page and its validators; pages without validators are skipped"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+        
+        page_path, meta_path = self._paths(url)
+        
+        # Page is written first so validators never point to a missing page
+        with open(page_path, 'wb') as f:
+            f.write(response.content)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'etag': etag, 'last_modified': last_modified}, f)
+
+
 class ScraperFactory:
     """Factory for creating scraper instances with different drivers"""
     
@@ -240,6 +457,10 @@ class ScraperFactory:
                 options.add_argument("--headless=new")
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+            options.page_load_strategy = 'eager'
             
             # Setup WebDriver
             service = Service(ChromeDriverManager().install())
@@ -279,10 +500,16 @@ if __name__ == "__main__":
     # links = scraper.scrape_cell_links()
     
     # Example 4: Scraping single page
+    # from atcc_scraper.parsers import PriceParser
     # url = 'https://www.atcc.org/products/crl-1658'
     # soup = ATCCScraper.scrape_cell_page(url)
     # if soup:
     #     print("Successfully scraped page!")
-    #     print(f"Title: {soup.title.string}")
+    #     print(f"Price: {PriceParser.extract_price(soup)}")
+    
+    # Example 5: Scraping single page with a Selenium fallback
+    # scraper = ScraperFactory.create_local_scraper(headless=True)
+    # soup = ATCCScraper.scrape_cell_page(url, driver=scraper.driver)
+    # scraper.driver.quit()
     
     print("See examples in comments above")
\ No newline at end of file